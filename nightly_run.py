@@ -5,44 +5,68 @@ import asyncio
 import logging
 import signal
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
 
-from src.research_engine import ResearchEngine
-from src.file_monitor import FileMonitor
-from src.thermal_monitor import ThermalMonitor
+from src.yaml_loader import SafeLoader
+
+if TYPE_CHECKING:
+    from src.research_engine import ResearchEngine
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(f'logs/research_{datetime.now():%Y%m%d}.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Thermal back-off: first re-check after the minimum, growing to the maximum
+THERMAL_COOLDOWN_MIN = 10.0  # seconds
+THERMAL_COOLDOWN_MAX = 120.0  # seconds
+
+
+def setup_logging():
+    """Log to console and a daily file (logs/ must already exist)."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(f'logs/research_{datetime.now():%Y%m%d}.log'),
+            logging.StreamHandler()
+        ]
+    )
+
 
 class NightlyResearcher:
     """Main application for overnight research."""
     
     def __init__(self, config_path: str = "config.yaml"):
         """Initialize the nightly researcher."""
+        # Imported here so startup checks in main() don't load crawl4ai/ollama/watchdog
+        from src.research_engine import ResearchEngine
+        from src.file_monitor import FileMonitor
+        from src.thermal_monitor import ThermalMonitor
+        
         # Load configuration
         with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=SafeLoader)
             
         # Initialize components
-        self.research_engine = ResearchEngine(config_path)
         self.file_monitor = FileMonitor(self.config)
         self.thermal_monitor = ThermalMonitor(self.config)
         
+        # Processed assignments are moved here
+        self.processed_dir = self.file_monitor.input_path / 'processed'
+        self.processed_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Assignments processed in parallel; 1 keeps the single-agent default.
+        # The engine keeps per-assignment state, so each worker gets its own.
+        concurrency = max(1, self.config['research'].get('concurrency', 1))
+        self.research_engines = [ResearchEngine(config_path) for _ in range(concurrency)]
+        
         # Control flags
         self.running = True
-        self.current_task = None
+        self.workers = []
+        self.busy_workers = 0
         
     async def run(self):
         """Main run loop."""
@@ -51,68 +75,99 @@ class NightlyResearcher:
         logger.info(f"Output to: {self.config['localsend']['output_path']}")
         
         # Start file monitoring
-        self.file_monitor.start()
+        await self.file_monitor.start()
+        
+        # Each worker pulls assignments from the shared queue
+        self.workers = [
+            asyncio.create_task(self._worker(worker_id, research_engine))
+            for worker_id, research_engine in enumerate(self.research_engines)
+        ]
+        # Idle status is debug-only, so don't wake up periodically otherwise
+        housekeeping = None
+        if logger.isEnabledFor(logging.DEBUG):
+            housekeeping = asyncio.create_task(self._housekeeping())
+        await asyncio.gather(*self.workers, return_exceptions=True)
         
-        # Main processing loop
+        # Cleanup
+        if housekeeping:
+            housekeeping.cancel()
+        self.file_monitor.stop()
+        logger.info("AI Researcher stopped")
+        
+    async def _worker(self, worker_id: int, research_engine: 'ResearchEngine'):
+        """Process assignments from the queue until shutdown."""
         while self.running:
             try:
-                # Check thermals
-                thermal_status = self.thermal_monitor.check_thermals()
-                if not thermal_status['safe']:
-                    logger.warning(f"Thermal warning: {thermal_status['warnings']}")
-                    await asyncio.sleep(60)  # Cool down period
-                    continue
-                    
-                # Get next assignment
+                # Block until an assignment arrives; shutdown cancels the wait
                 assignment_path = await self.file_monitor.get_next_assignment()
                 
-                if assignment_path:
-                    logger.info(f"Processing assignment: {assignment_path}")
-                    self.current_task = asyncio.create_task(
-                        self._process_assignment(assignment_path)
-                    )
-                    await self.current_task
-                else:
-                    # No assignment, log status
-                    usage = self.thermal_monitor.get_resource_usage()
-                    logger.debug(
-                        f"Idle - CPU: {usage['cpu_percent']:.1f}% "
-                        f"GPU: {usage['gpu_percent']:.1f}% "
-                        f"Temp: {thermal_status['cpu_temp']:.1f}°C"
-                    )
+                # Only start work once thermals are safe
+                await self._wait_for_safe_thermals()
+                if not self.running:
+                    break
+                    
+                logger.info(f"Worker {worker_id} processing assignment: {assignment_path}")
+                self.busy_workers += 1
+                try:
+                    await self._process_assignment(research_engine, assignment_path)
+                finally:
+                    self.busy_workers -= 1
                     
             except asyncio.CancelledError:
                 logger.info("Received shutdown signal")
                 break
             except Exception as e:
-                logger.error(f"Error in main loop: {e}", exc_info=True)
+                logger.error(f"Error in worker {worker_id}: {e}", exc_info=True)
                 await asyncio.sleep(60)
                 
-        # Cleanup
-        self.file_monitor.stop()
-        logger.info("AI Researcher stopped")
+    async def _housekeeping(self):
+        """Periodically log system status at debug level while every worker is idle."""
+        while self.running:
+            await asyncio.sleep(self.file_monitor.check_interval)
+            if self.busy_workers:
+                continue
+            thermal_status = self.thermal_monitor.check_thermals()
+            usage = self.thermal_monitor.get_resource_usage()
+            logger.debug(
+                "Idle - CPU: %.1f%% GPU: %.1f%% Temp: %.1f°C",
+                usage['cpu_percent'], usage['gpu_percent'],
+                thermal_status['cpu_temp']
+            )
+            
+    async def _wait_for_safe_thermals(self):
+        """Wait until thermals are within limits before starting work.
         
-    async def _process_assignment(self, assignment_path: Path):
+        Re-checks with exponential back-off, so a brief spike clears quickly
+        while a long one isn't polled constantly.
+        """
+        cooldown = THERMAL_COOLDOWN_MIN
+        thermal_status = self.thermal_monitor.check_thermals()
+        while not thermal_status['safe'] and self.running:
+            logger.warning(f"Thermal warning: {thermal_status['warnings']} "
+                           f"- cooling down for {cooldown:.0f}s")
+            await asyncio.sleep(cooldown)
+            cooldown = min(cooldown * 1.5, THERMAL_COOLDOWN_MAX)
+            thermal_status = self.thermal_monitor.check_thermals()
+            
+    async def _process_assignment(self, research_engine: 'ResearchEngine', assignment_path: Path):
         """Process a single research assignment."""
-        start_time = datetime.now()
+        start_time = time.monotonic()
         
         try:
             # Run research
-            reports = await self.research_engine.process_assignment(assignment_path)
+            reports = await research_engine.process_assignment(assignment_path)
             
             # Save reports to LocalSend
             for report in reports:
-                output_path = self.file_monitor.save_report(report)
+                output_path = await self.file_monitor.save_report(report)
                 logger.info(f"Report saved: {output_path}")
                 
             # Log completion
-            duration = (datetime.now() - start_time).total_seconds() / 60
+            duration = (time.monotonic() - start_time) / 60
             logger.info(f"Assignment completed in {duration:.1f} minutes")
             
-            # Move processed assignment
-            processed_dir = assignment_path.parent / 'processed'
-            processed_dir.mkdir(exist_ok=True)
-            assignment_path.rename(processed_dir / assignment_path.name)
+            # Move processed assignment (replace handles re-used names on Windows too)
+            assignment_path.replace(self.processed_dir / assignment_path.name)
             
         except Exception as e:
             logger.error(f"Error processing assignment: {e}", exc_info=True)
@@ -121,15 +176,16 @@ class NightlyResearcher:
             error_report = Path('output') / f"ERROR_{assignment_path.stem}_{datetime.now():%Y%m%d_%H%M}.txt"
             error_report.parent.mkdir(exist_ok=True)
             error_report.write_text(f"Error processing {assignment_path}:\n{str(e)}")
-            self.file_monitor.save_report(error_report)
+            await self.file_monitor.save_report(error_report)
             
     def shutdown(self, signum=None, frame=None):
         """Graceful shutdown."""
         logger.info("Initiating shutdown...")
         self.running = False
         
-        if self.current_task and not self.current_task.done():
-            self.current_task.cancel()
+        for worker in self.workers:
+            if not worker.done():
+                worker.cancel()
 
 
 async def main():
@@ -138,6 +194,8 @@ async def main():
     for dir_name in ['logs', 'output', 'checkpoints']:
         Path(dir_name).mkdir(exist_ok=True)
         
+    setup_logging()
+        
     # Check for config
     if not Path('config.yaml').exists():
         logger.error("config.yaml not found! Copy config.example.yaml and update it.")
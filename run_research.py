@@ -57,9 +57,12 @@ async def main():
     print("This will take 10-20 minutes to complete.")
     print("Watch the progress here or check the log file.\n")
     
+    # --resume continues an interrupted run from its latest checkpoint
+    resume = '--resume' in sys.argv[1:]
+    
     try:
         engine = ResearchEngine('config.yaml')
-        reports = await engine.process_assignment(assignment_path)
+        reports = await engine.process_assignment(assignment_path, resume=resume)
         
         print(f"\n✅ Research complete! Generated {len(reports)} report(s):")
         for report in reports:
@@ -70,11 +73,12 @@ async def main():
             print(f"\n{'='*60}")
             print("REPORT PREVIEW (first 1000 chars):")
             print('='*60)
-            with open(reports[0], 'r') as f:
-                content = f.read()
-                print(content[:1000])
-                if len(content) > 1000:
-                    print(f"\n... (full report is {len(content)} chars)")
+            # Only read what we show, plus one char to know if there's more
+            with open(reports[0], 'r', encoding='utf-8', errors='replace') as f:
+                preview = f.read(1001)
+            print(preview[:1000])
+            if len(preview) > 1000:
+                print(f"\n... (full report is {reports[0].stat().st_size} bytes)")
             
             print(f"\n📄 Full report saved to: {reports[0]}")
             
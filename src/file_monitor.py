@@ -1,16 +1,35 @@
 """Monitor LocalSend folder for new research assignments."""
 
 import asyncio
+import functools
 import logging
+import os
+import shutil
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Set
+from typing import List, Optional
 
 import yaml
-from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileCreatedEvent
 
+from .yaml_loader import SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Fields every research assignment must define
+_REQUIRED_FIELDS = frozenset(('title', 'objectives'))
+
+# How many processed paths to remember before forgetting the oldest
+PROCESSED_FILES_MAX = 4096
+
+
+@functools.lru_cache(maxsize=256)
+def _load_assignment(path: str, mtime_ns: int, size: int):
+    """Parse an assignment file. mtime/size only key the cache so edits re-parse."""
+    # libyaml parses bytes directly, so skip Python-side decoding
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
 
 class AssignmentHandler(FileSystemEventHandler):
     """Handle new assignment files in LocalSend folder."""
@@ -18,7 +37,10 @@ class AssignmentHandler(FileSystemEventHandler):
     def __init__(self, queue: asyncio.Queue):
         """Initialize the handler with an async queue."""
         self.queue = queue
-        self.processed_files: Set[Path] = set()
+        # Bounded LRU of handled paths so a long-running monitor doesn't grow forever
+        self.processed_files: OrderedDict[Path, None] = OrderedDict()
+        # Event loop that owns the queue; set by FileMonitor.start()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
         
     def on_created(self, event: FileCreatedEvent):
         """Handle new file creation events."""
@@ -33,29 +55,33 @@ class AssignmentHandler(FileSystemEventHandler):
             
             # Validate it's a research assignment
             if self._is_valid_assignment(file_path):
-                # Add to queue for processing
-                asyncio.create_task(self._add_to_queue(file_path))
-                self.processed_files.add(file_path)
+                # Watchdog calls this from its observer thread, so hand the
+                # path to the event loop rather than touching the queue here
+                self.loop.call_soon_threadsafe(self.queue.put_nowait, file_path)
+                self.mark_processed(file_path)
             else:
                 logger.warning(f"Invalid assignment format: {file_path}")
                 
-    def _is_valid_assignment(self, file_path: Path) -> bool:
+    def mark_processed(self, file_path: Path):
+        """Remember a handled path, evicting the oldest beyond the limit."""
+        self.processed_files[file_path] = None
+        self.processed_files.move_to_end(file_path)
+        if len(self.processed_files) > PROCESSED_FILES_MAX:
+            self.processed_files.popitem(last=False)
+            
+    def _is_valid_assignment(self, file_path: Path, stat: Optional[os.stat_result] = None) -> bool:
         """Check if file is a valid research assignment."""
         try:
-            with open(file_path, 'r') as f:
-                data = yaml.safe_load(f)
+            if stat is None:
+                stat = file_path.stat()
+            data = _load_assignment(str(file_path), stat.st_mtime_ns, stat.st_size)
                 
-            # Check for required fields
-            required = ['title', 'objectives']
-            return all(field in data for field in required)
+            # Check for required fields (a bare scalar or list isn't an assignment)
+            return isinstance(data, dict) and _REQUIRED_FIELDS.issubset(data)
             
         except Exception as e:
             logger.error(f"Error validating assignment {file_path}: {e}")
             return False
-            
-    async def _add_to_queue(self, file_path: Path):
-        """Add file to async processing queue."""
-        await self.queue.put(file_path)
 
 
 class FileMonitor:
@@ -74,16 +100,21 @@ class FileMonitor:
         # Assignment queue
         self.assignment_queue = asyncio.Queue()
         
-        # File system observer
+        # File system observer (imported here: it pulls in the platform
+        # backend, which modules that only need the handler can skip)
+        from watchdog.observers import Observer
         self.observer = Observer()
         self.handler = AssignmentHandler(self.assignment_queue)
         
-    def start(self):
+    async def start(self):
         """Start monitoring for files."""
         logger.info(f"Starting file monitor on: {self.input_path}")
         
+        # Events arrive on the observer thread and are passed back to this loop
+        self.handler.loop = asyncio.get_running_loop()
+        
         # Check for existing assignments
-        self._check_existing_assignments()
+        await self._check_existing_assignments()
         
         # Start watching for new files
         self.observer.schedule(self.handler, str(self.input_path), recursive=False)
@@ -94,33 +125,43 @@ class FileMonitor:
         self.observer.stop()
         self.observer.join()
         
-    def _check_existing_assignments(self):
+    async def _check_existing_assignments(self):
         """Check for any existing assignment files."""
-        for file_path in self.input_path.glob('*.yaml'):
-            if file_path not in self.handler.processed_files:
-                if self.handler._is_valid_assignment(file_path):
-                    logger.info(f"Found existing assignment: {file_path}")
-                    asyncio.create_task(self.handler._add_to_queue(file_path))
-                    self.handler.processed_files.add(file_path)
+        # Scanning and parsing YAML is blocking file I/O; keep it off the event loop
+        found = await asyncio.to_thread(self._scan_existing_assignments)
                     
-    async def get_next_assignment(self) -> Optional[Path]:
-        """Get the next assignment from the queue."""
-        try:
-            # Wait for assignment with timeout
-            assignment = await asyncio.wait_for(
-                self.assignment_queue.get(),
-                timeout=self.check_interval
-            )
-            return assignment
-        except asyncio.TimeoutError:
-            return None
+        # We're on the loop thread and the queue is unbounded, so enqueue directly
+        for file_path in found:
+            self.assignment_queue.put_nowait(file_path)
+            self.handler.mark_processed(file_path)
+                    
+    def _scan_existing_assignments(self) -> List[Path]:
+        """Return valid, unprocessed assignment files already in the input folder."""
+        found = []
+        with os.scandir(self.input_path) as entries:
+            for entry in entries:
+                if not (entry.name.endswith(('.yaml', '.yml')) and entry.is_file()):
+                    continue
+                file_path = Path(entry.path)
+                # Key the parse cache on the entry's stat (cached on the DirEntry)
+                if (file_path not in self.handler.processed_files
+                        and self.handler._is_valid_assignment(file_path, entry.stat())):
+                    logger.info(f"Found existing assignment: {file_path}")
+                    found.append(file_path)
+        return found
+        
+    async def get_next_assignment(self) -> Path:
+        """Wait for the next assignment from the queue."""
+        # The watcher pushes new files, so just block until one arrives
+        return await self.assignment_queue.get()
             
-    def save_report(self, report_path: Path) -> Path:
+    async def save_report(self, report_path: Path) -> Path:
         """Copy report to LocalSend output folder."""
         output_file = self.output_path / report_path.name
         
-        # Copy file to output
-        output_file.write_bytes(report_path.read_bytes())
+        # Copy file to output in a thread so other workers keep running
+        # (copyfile streams in chunks or in-kernel; the report is never held in memory)
+        await asyncio.to_thread(shutil.copyfile, report_path, output_file)
         logger.info(f"Report saved to LocalSend: {output_file}")
         
         return output_file
\ No newline at end of file
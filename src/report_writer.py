@@ -1,16 +1,48 @@
 """Report generation for research findings."""
 
+import asyncio
+import heapq
 import logging
+import re
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Set
 from collections import defaultdict
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
 
+# Words too common to say which objective a finding belongs to
+_STOPWORDS = frozenset((
+    'about', 'all', 'and', 'any', 'are', 'but', 'can', 'for', 'from', 'has',
+    'have', 'how', 'into', 'its', 'not', 'our', 'that', 'the', 'their', 'them',
+    'they', 'this', 'was', 'were', 'what', 'which', 'who', 'will', 'with', 'your',
+))
+
+# Words shorter than this are ignored when grouping findings
+_MIN_TOKEN_LENGTH = 3
+
+# Group name for findings that match no objective
+_OTHER_GROUP = 'Other'
+
+
+def _tokenize(text: str) -> Set[str]:
+    """Lowercase content words of text, without stopwords and short tokens."""
+    return {word for word in re.findall(r'\w+', text.lower())
+            if len(word) >= _MIN_TOKEN_LENGTH and word not in _STOPWORDS}
+
+
+def _safe_label(text: str) -> str:
+    """Text reduced to characters that are safe in a filename on any platform."""
+    return ' '.join(re.sub(r'[^\w\s.-]', ' ', text).split())
+
+
+def _source_count(item) -> int:
+    """Sort key: number of sources a company was found in."""
+    return len(item[1])
+
+
 class ReportWriter:
     """Generates markdown reports from research findings."""
     
@@ -33,28 +65,44 @@ class ReportWriter:
         report_style = assignment.get('report_style', 'bullets')
         output_format = assignment.get('output', {}).get('format', 'single')
         
+        # One timestamp per run so every report in the set agrees
+        now = datetime.now()
+        date_str = now.strftime('%Y-%m-%d %H:%M')
+        stamp = now.strftime('%Y%m%d_%H%M')
+        
         reports = []
         
         if output_format == 'single':
             # Generate one comprehensive report
             report = await self._generate_single_report(
-                assignment, findings, strategy, report_style
+                assignment, findings, strategy, report_style, date_str, stamp
             )
             reports.append(report)
         else:
             # Generate multiple focused reports
             grouped_findings = self._group_findings(findings, assignment)
             
-            for group_name, group_findings in grouped_findings.items():
-                report = await self._generate_focused_report(
-                    assignment, group_findings, group_name, report_style
+            # Nothing to group still deserves a report rather than none at all
+            if not grouped_findings:
+                report = await self._generate_single_report(
+                    assignment, findings, strategy, report_style, date_str, stamp
+                )
+                return [report]
+                
+            # Each report writes its own file, so build them concurrently
+            reports.extend(await asyncio.gather(*(
+                self._generate_focused_report(
+                    assignment, group_findings, group_name, strategy, report_style,
+                    date_str, stamp
                 )
-                reports.append(report)
+                for group_name, group_findings in grouped_findings.items()
+            )))
                 
         return reports
         
     async def _generate_single_report(self, assignment: Dict, findings: List[Dict],
-                                    strategy: Dict, style: str) -> Path:
+                                    strategy: Dict, style: str, date_str: str,
+                                    stamp: str) -> Path:
         """Generate a single comprehensive report."""
         # Extract structured data from findings
         structured_data = self._extract_all_structured_data(findings)
@@ -71,24 +119,84 @@ class ReportWriter:
             report_content = self._generate_bullet_report(
                 assignment, strategy, companies_section, challenges_section,
                 solutions_section, decision_makers_section, insights_section,
-                findings, structured_data
+                findings, structured_data, date_str
             )
         else:
             # For now, use bullet format for all styles
             report_content = self._generate_bullet_report(
                 assignment, strategy, companies_section, challenges_section,
                 solutions_section, decision_makers_section, insights_section,
-                findings, structured_data
+                findings, structured_data, date_str
             )
         
         # Save report
-        report_path = Path('output') / f"{assignment['title'][:50]}_{datetime.now():%Y%m%d_%H%M}.md"
+        # Titles are free-form text; keep path separators and : or ? out of the filename
+        file_label = _safe_label(assignment['title'])[:50].strip() or 'report'
+        report_path = Path('output') / f"{file_label}_{stamp}.md"
         report_path.parent.mkdir(exist_ok=True)
-        report_path.write_text(report_content)
+        await asyncio.to_thread(report_path.write_text, report_content)
         
         logger.info(f"Report generated: {report_path}")
         return report_path
         
+    async def _generate_focused_report(self, assignment: Dict, findings: List[Dict],
+                                     group_name: str, strategy: Dict, style: str,
+                                     date_str: str, stamp: str) -> Path:
+        """Generate a report covering the findings for a single objective."""
+        # Lead with the group name so each focused report gets its own file
+        focused = dict(assignment, title=f"{group_name} - {assignment['title']}")
+        return await self._generate_single_report(focused, findings, strategy, style,
+                                                  date_str, stamp)
+        
+    def _group_findings(self, findings: List[Dict], assignment: Dict) -> Dict[str, List[Dict]]:
+        """Group findings by the objective they share words with.
+        
+        Findings matching no objective are collected under "Other" so none are dropped.
+        """
+        objectives = assignment['objectives']
+        
+        # Tokenize every objective and finding once, then match with set intersection
+        objective_tokens = zip(self._objective_labels(objectives),
+                               (_tokenize(obj) for obj in objectives))
+        finding_tokens = [self._finding_tokens(f) for f in findings]
+        
+        groups = {}
+        matched_any = [False] * len(findings)
+        for key, tokens in objective_tokens:
+            matched = []
+            for i, ft in enumerate(finding_tokens):
+                if ft & tokens:
+                    matched.append(findings[i])
+                    matched_any[i] = True
+            if matched:
+                groups[key] = matched
+                
+        unmatched = [f for f, hit in zip(findings, matched_any) if not hit]
+        if unmatched:
+            groups[_OTHER_GROUP] = unmatched
+        return groups
+        
+    def _objective_labels(self, objectives: List[str]) -> List[str]:
+        """Short group label per objective, unique even when objectives share a prefix."""
+        labels = []
+        seen = {_OTHER_GROUP}
+        for i, obj in enumerate(objectives, 1):
+            base = _safe_label(obj)[:30].strip() or f"Objective {i}"
+            label, n = base, 2
+            while label in seen:
+                label, n = f"{base} ({n})", n + 1
+            seen.add(label)
+            labels.append(label)
+        return labels
+        
+    def _finding_tokens(self, finding: Dict) -> Set[str]:
+        """Lowercase word set for a finding's title and key insights."""
+        insights = finding.get('extracted_data', {}).get('key_insights') or []
+        if not isinstance(insights, list):
+            insights = [insights]
+        text = ' '.join([finding.get('title', '')] + [str(i) for i in insights])
+        return _tokenize(text)
+        
     def _extract_all_structured_data(self, findings: List[Dict]) -> Dict:
         """Extract all structured data from findings."""
         data = {
@@ -115,7 +223,9 @@ class ReportWriter:
             if extracted.get('companies'):
                 for company in extracted['companies']:
                     if isinstance(company, dict):
-                        data['companies'][company.get('name', str(company))].append({
+                        # Only stringify the whole dict when it has no name field
+                        name = company.get('name')
+                        data['companies'][name if name is not None else str(company)].append({
                             'context': company.get('context', ''),
                             'source': source_info
                         })
@@ -196,13 +306,16 @@ class ReportWriter:
             return "*No specific companies identified yet*\n"
         
         sections = []
-        for company, contexts in list(companies.items())[:10]:  # Top 10 companies
-            section = f"### {company}\n"
-            if contexts[0]['context']:
-                section += f"- Context: {contexts[0]['context']}\n"
-            section += f"- Found in {len(contexts)} source(s)\n"
-            section += f"- [Source: {contexts[0]['source']['title']}]({contexts[0]['source']['url']})\n"
-            sections.append(section)
+        for company, contexts in heapq.nlargest(10, companies.items(), key=_source_count):  # Top 10 companies
+            first = contexts[0]
+            source = first['source']
+            # Build each section from parts and join once instead of repeated +=
+            parts = [f"### {company}\n"]
+            if first['context']:
+                parts.append(f"- Context: {first['context']}\n")
+            parts.append(f"- Found in {len(contexts)} source(s)\n")
+            parts.append(f"- [Source: {source['title']}]({source['url']})\n")
+            sections.append(''.join(parts))
         
         return "\n".join(sections)
         
@@ -289,7 +402,7 @@ class ReportWriter:
     def _generate_bullet_report(self, assignment, strategy, companies_section,
                                challenges_section, solutions_section,
                                decision_makers_section, insights_section,
-                               findings, structured_data):
+                               findings, structured_data, date_str):
         """Generate a bullet-point style report."""
         
         # Count unique items
@@ -298,13 +411,16 @@ class ReportWriter:
         solution_count = len(set(item['solution'] for item in structured_data['solutions']))
         decision_maker_count = len(structured_data['decision_makers'])
         
+        # One pass over findings gives both the source count and the citations
+        sources = self._collect_sources(findings)
+        
         # Get the number of cycles (it's already a number, not a list)
         num_cycles = strategy.get('cycles', 3)
         
         return f"""# {assignment['title']}
 
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M')}  
-**Sources Analyzed**: {len(set(f['url'] for f in findings if 'url' in f))}  
+**Generated**: {date_str}  
+**Sources Analyzed**: {len(sources)}  
 **Companies Found**: {company_count}  
 **Decision Makers**: {decision_maker_count}  
 **Training Solutions**: {solution_count}  
@@ -345,24 +461,27 @@ Research identified **{company_count} Japanese tech companies** with English com
 
 ## Sources
 
-{self._format_sources(findings)}
+{self._format_sources(sources)}
 
 ---
 *Report generated by AI Researcher - Overnight Research Assistant*
 """
         
-    def _format_sources(self, findings: List[Dict]) -> str:
-        """Format unique sources as citations."""
+    def _collect_sources(self, findings: List[Dict]) -> Dict[str, str]:
+        """Map each unique source URL to its title, in first-seen order."""
         sources = {}
         for f in findings:
             if 'url' in f and f['url'] not in sources:
                 sources[f['url']] = f.get('title', 'Untitled')
-                
+        return sources
+        
+    def _format_sources(self, sources: Dict[str, str]) -> str:
+        """Format unique sources as citations."""
         formatted = []
-        for i, (url, title) in enumerate(sources.items(), 1):
+        for i, (url, title) in enumerate(islice(sources.items(), 30), 1):  # Limit to 30 sources
             formatted.append(f"{i}. [{title}]({url})")
             
-        return '\n'.join(formatted[:30])  # Limit to 30 sources
+        return '\n'.join(formatted)
         
     def _bullet_template(self) -> str:
         """Bullet point report template."""
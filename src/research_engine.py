@@ -3,18 +3,28 @@
 import asyncio
 import json
 import logging
-from datetime import datetime
+import os
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
 import yaml
 from ollama import AsyncClient
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .web_researcher import WebResearcher
 from .report_writer import ReportWriter
+from .yaml_loader import SafeLoader
 
 logger = logging.getLogger(__name__)
 
+# Checkpoints older than this are considered stale and never resumed
+CHECKPOINT_MAX_AGE = timedelta(hours=24)
+
 
 class ResearchEngine:
     """Main research orchestration engine."""
@@ -23,7 +33,7 @@ class ResearchEngine:
         """Initialize the research engine with configuration."""
         self.config_path = config_path
         with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=SafeLoader)
             
         self.ollama = AsyncClient(
             host=f"{self.config['ollama']['host']}:{self.config['ollama']['port']}"
@@ -32,29 +42,50 @@ class ResearchEngine:
         self.report_writer = ReportWriter()
         self.checkpoint_data = {}
         
-    async def process_assignment(self, assignment_path: Path) -> List[Path]:
-        """Process a research assignment and generate reports."""
-        logger.info(f"Processing assignment: {assignment_path}")
+    async def process_assignment(self, assignment: Union[Path, Dict],
+                                 resume: bool = False) -> List[Path]:
+        """Process a research assignment and generate reports.
         
-        # Load assignment
-        with open(assignment_path, 'r') as f:
-            assignment = yaml.safe_load(f)
+        The assignment may be a path to a YAML file or an already-loaded dict.
+        With resume=True, continue from the latest fresh checkpoint for this
+        assignment instead of re-running completed cycles.
+        """
+        if isinstance(assignment, dict):
+            logger.info(f"Processing assignment: {assignment.get('title', 'Untitled')}")
+        else:
+            logger.info(f"Processing assignment: {assignment}")
             
-        # Develop research strategy
-        strategy = await self.develop_strategy(assignment)
-        logger.info(f"Strategy developed: {strategy['approach']}")
+            # Load assignment
+            with open(assignment, 'r') as f:
+                assignment = yaml.load(f, Loader=SafeLoader)
+            
+        checkpoint = self._load_checkpoint(assignment) if resume else None
         
-        # Initialize tracking for found entities
-        self.found_entities = {
-            'companies': set(),
-            'decision_makers': set(),
-            'solutions': set(),
-            'challenges': set()
-        }
+        if checkpoint:
+            # Pick up where the interrupted run left off
+            strategy = checkpoint['strategy']
+            all_findings = checkpoint['findings']
+            self.found_entities = {k: set(v) for k, v in checkpoint['found_entities'].items()}
+            start_cycle = checkpoint['cycle'] + 1
+            logger.info(f"Resuming from checkpoint after cycle {start_cycle} "
+                       f"({len(all_findings)} findings)")
+        else:
+            # Develop research strategy
+            strategy = await self.develop_strategy(assignment)
+            logger.info(f"Strategy developed: {strategy['approach']}")
+            
+            # Initialize tracking for found entities
+            self.found_entities = {
+                'companies': set(),
+                'decision_makers': set(),
+                'solutions': set(),
+                'challenges': set()
+            }
+            all_findings = []
+            start_cycle = 0
         
         # Execute research cycles
-        all_findings = []
-        for cycle in range(min(strategy['cycles'], self.config['research']['max_cycles'])):
+        for cycle in range(start_cycle, min(strategy['cycles'], self.config['research']['max_cycles'])):
             logger.info(f"Starting research cycle {cycle + 1}")
             
             # Execute research
@@ -64,12 +95,12 @@ class ResearchEngine:
             # Update our entity tracking
             self._update_found_entities(findings)
             
-            # Checkpoint progress
-            await self.checkpoint(assignment, all_findings, cycle)
-            
             # Refine strategy based on findings
             strategy = await self.refine_strategy(strategy, all_findings, assignment)
             
+            # Checkpoint progress with the refined strategy the next cycle will use
+            await self.checkpoint(assignment, all_findings, cycle, strategy)
+            
             # Log progress
             logger.info(f"Cycle {cycle + 1} complete. Found {len(self.found_entities['companies'])} companies, "
                        f"{len(self.found_entities['decision_makers'])} decision makers")
@@ -332,7 +363,9 @@ class ResearchEngine:
                 if data.get('companies'):
                     for company in data['companies']:
                         if isinstance(company, dict):
-                            self.found_entities['companies'].add(company.get('name', company.get('company', str(company))))
+                            # Only stringify the whole dict when it has no name field
+                            name = company.get('name', company.get('company'))
+                            self.found_entities['companies'].add(name if name is not None else str(company))
                         else:
                             self.found_entities['companies'].add(str(company))
                 
@@ -367,10 +400,12 @@ class ResearchEngine:
                     summary_parts.append(f"From {finding['title']}: {insights[0] if isinstance(insights, list) else insights}")
         return "\n".join(summary_parts) if summary_parts else "No specific insights yet"
         
-    async def checkpoint(self, assignment: Dict, findings: List, cycle: int):
+    async def checkpoint(self, assignment: Dict, findings: List, cycle: int,
+                         strategy: Optional[Dict] = None):
         """Save checkpoint for crash recovery."""
         checkpoint = {
             'assignment': assignment,
+            'strategy': strategy,
             'findings': findings,
             'found_entities': {k: list(v) for k, v in self.found_entities.items()},
             'cycle': cycle,
@@ -380,5 +415,56 @@ class ResearchEngine:
         checkpoint_path = Path('checkpoints') / f"{assignment['title'][:30]}_{cycle}.json"
         checkpoint_path.parent.mkdir(exist_ok=True)
         
-        with open(checkpoint_path, 'w') as f:
-            json.dump(checkpoint, f, indent=2)
+        # Write to a temp file and swap it in so a crash never leaves a partial checkpoint
+        tmp_path = checkpoint_path.with_suffix('.json.tmp')
+        if ORJSON_AVAILABLE:
+            # OPT_NON_STR_KEYS stringifies int keys from the YAML, as json.dump does
+            tmp_path.write_bytes(orjson.dumps(
+                checkpoint, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(tmp_path, 'w') as f:
+                json.dump(checkpoint, f, indent=2)
+        os.replace(tmp_path, checkpoint_path)
+            
+    def _load_checkpoint(self, assignment: Dict) -> Optional[Dict]:
+        """Load the latest resumable checkpoint for an assignment, if any."""
+        checkpoint_dir = Path('checkpoints')
+        if not checkpoint_dir.exists():
+            return None
+            
+        # Checkpoints are named "<title[:30]>_<cycle>.json" and outlive their run,
+        # so pick the most recently written one rather than the highest cycle
+        prefix = f"{assignment['title'][:30]}_"
+        latest_key, latest_path = None, None
+        for path in checkpoint_dir.glob('*.json'):
+            cycle = path.stem[len(prefix):]
+            if not (path.stem.startswith(prefix) and cycle.isdigit()):
+                continue
+            key = (path.stat().st_mtime_ns, int(cycle))
+            if latest_key is None or key > latest_key:
+                latest_key, latest_path = key, path
+                
+        if latest_path is None:
+            return None
+            
+        try:
+            if ORJSON_AVAILABLE:
+                checkpoint = orjson.loads(latest_path.read_bytes())
+            else:
+                with open(latest_path, 'r') as f:
+                    checkpoint = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not read checkpoint {latest_path}: {e}")
+            return None
+            
+        # Only resume the same assignment, from a checkpoint that has a strategy
+        if checkpoint.get('assignment') != assignment or not checkpoint.get('strategy'):
+            logger.info(f"Checkpoint {latest_path} does not match this assignment, starting fresh")
+            return None
+            
+        age = datetime.now() - datetime.fromisoformat(checkpoint['timestamp'])
+        if age > CHECKPOINT_MAX_AGE:
+            logger.info(f"Checkpoint {latest_path} is stale ({age}), starting fresh")
+            return None
+            
+        return checkpoint
@@ -10,6 +10,8 @@ import httpx
 from crawl4ai import AsyncWebCrawler
 from ollama import AsyncClient
 
+from .yaml_loader import SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,7 +21,7 @@ class WebResearcher:
     def __init__(self, config_path: str = "config.yaml"):
         """Initialize the web researcher."""
         with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=SafeLoader)
             
         self.ollama = AsyncClient()
         self.model = self.config['ollama']['model']  # Get model from config
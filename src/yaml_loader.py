@@ -0,0 +1,9 @@
+"""Fastest available safe YAML loader."""
+
+# libyaml's C loader is several times faster; fall back to pure Python without it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+__all__ = ['SafeLoader']
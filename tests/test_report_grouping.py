@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Test that focused-report grouping never drops findings."""
+
+import asyncio
+import os
+from pathlib import Path
+import sys
+import tempfile
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.report_writer import ReportWriter
+
+
+def _finding(title):
+    """Minimal finding with only a title."""
+    return {'url': f"https://example.com/{len(title)}", 'title': title, 'extracted_data': {}}
+
+
+def test_objectives_sharing_a_prefix():
+    """Objectives with the same first 30 chars keep separate groups."""
+    assignment = {'objectives': [
+        "Find Japanese companies hiring in Tokyo",
+        "Find Japanese companies hiring in Osaka",
+    ]}
+    findings = [_finding("Tokyo fintech startups"), _finding("Osaka manufacturers")]
+
+    groups = ReportWriter()._group_findings(findings, assignment)
+
+    assert list(groups) == ["Find Japanese companies hiring", "Find Japanese companies hiring (2)"]
+    assert [f['title'] for f in groups["Find Japanese companies hiring"]] == ["Tokyo fintech startups"]
+    assert [f['title'] for f in groups["Find Japanese companies hiring (2)"]] == ["Osaka manufacturers"]
+
+
+def test_unmatched_findings_go_to_other():
+    """Findings matching no objective are kept under Other."""
+    assignment = {'objectives': ["Other", "English training budgets"]}
+    findings = [_finding("English training at Rakuten"), _finding("Weather report")]
+
+    groups = ReportWriter()._group_findings(findings, assignment)
+
+    assert [f['title'] for f in groups["English training budgets"]] == ["English training at Rakuten"]
+    assert [f['title'] for f in groups["Other"]] == ["Weather report"]
+
+
+def test_focused_report_filenames_are_safe():
+    """Objectives with path or Windows-invalid characters still write into output/."""
+    assignment = {
+        'title': "Japan/English: who?",
+        'objectives': ["Companies: training/English", "Budgets?"],
+        'output': {'format': 'multiple'},
+    }
+    findings = [_finding("English training companies"), _finding("Training budgets")]
+    strategy = {'approach': 'test', 'cycles': 1}
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            reports = asyncio.run(ReportWriter().generate_reports(assignment, findings, strategy))
+            assert len(reports) == 2
+            for report in reports:
+                assert report.parent == Path('output')
+                assert not set(report.name) & set('/\\:?'), report.name
+                assert report.exists()
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    for test in (test_objectives_sharing_a_prefix, test_unmatched_findings_go_to_other,
+                 test_focused_report_filenames_are_safe):
+        test()
+        print(f"✓ {test.__name__}")